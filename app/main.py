@@ -4,35 +4,57 @@ Solar Challenge Interactive Dashboard
 
 A production-ready Streamlit dashboard for visualizing solar radiation data
 from Benin, Sierra Leone, and Togo.
+
+Cached helpers are keyed on `data_sig` (the source file signature plus the
+active date filter) and receive DataFrames through underscore-prefixed
+parameters, which Streamlit skips when hashing, so cache lookups stay O(1)
+instead of hashing the whole frame.
 """
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import polars as pl
+import io
+import os
+import re
 import sys
+import time
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# `pip install -e .` makes `src` importable directly; otherwise fall back to
+# the repository root, added once rather than on every script rerun
+ROOT_DIR = str(Path(__file__).resolve().parent.parent)
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
 
 from src.data_loader import (
     load_solar_data, 
+    read_csv_polars,
+    read_csv_columns,
+    DASHBOARD_COLUMNS,
+    index_by_timestamp,
+    compact_dtypes,
     get_available_metrics, 
     get_date_range,
     filter_by_date_range,
     get_summary_statistics,
+    get_hourly_averages,
+    get_monthly_averages,
+    get_correlation_matrix,
     get_top_hours
 )
-from src.plot_utils import (
-    create_boxplot,
-    create_time_series,
-    create_correlation_heatmap,
-    create_scatter_plot,
-    create_bubble_chart,
-    create_wind_distribution,
-    create_hourly_pattern,
-    create_monthly_pattern,
-    create_distribution_plot
-)
+# src.plot_utils (and with it Plotly) is imported inside the functions that
+# draw figures, so the landing page renders before any dataset is loaded
+
+# Figures are cached as shared objects (st.cache_resource) rather than
+# pickled copies; st.plotly_chart only serializes them, never mutates them
+FIGURE_CACHE_ENTRIES = 64
+
+# Correlations are bounded, so their bars share a fixed -1..1 scale
+CORRELATION_COLUMN_CONFIG = {
+    'Correlation': st.column_config.ProgressColumn(format="%.3f", min_value=-1.0, max_value=1.0)
+}
 
 # Page configuration
 st.set_page_config(
@@ -43,196 +65,546 @@ st.set_page_config(
 )
 
 # Custom CSS for responsive and modern styling
-st.markdown("""
-    <style>
-    /* Main Header Styling */
-    .main-header {
-        font-size: clamp(1.8rem, 4vw, 2.8rem);
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        text-align: center;
-        margin-bottom: 0.5rem;
-        padding: 0.5rem;
-    }
-    
-    /* Sub Header */
-    .sub-header {
-        font-size: clamp(0.9rem, 2vw, 1.2rem);
-        color: #666;
-        text-align: center;
-        margin-bottom: 1.5rem;
-        font-weight: 400;
-    }
-    
-    /* Metric Cards */
-    .metric-card {
-        background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 12px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Responsive Containers */
-    .block-container {
-        padding: 1rem 2rem;
-        max-width: 100%;
-    }
-    
-    @media (max-width: 768px) {
-        .block-container {
-            padding: 0.5rem 1rem;
-        }
-    }
-    
-    /* Custom Sidebar Styling */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
-    }
-    
-    section[data-testid="stSidebar"] .css-1d391kg {
-        padding: 1rem;
-    }
-    
-    /* Enhanced Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        flex-wrap: wrap;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: #f0f2f6;
-        border-radius: 8px 8px 0 0;
-        gap: 1px;
-        padding: 10px 16px;
-        font-weight: 500;
-        transition: all 0.2s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: #e0e2e6;
-        transform: translateY(-2px);
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white !important;
-    }
-    
-    /* Info Boxes */
-    .stAlert {
-        border-radius: 10px;
-        border-left: 5px solid #667eea;
-        padding: 1rem;
-        background-color: #f8f9ff;
-    }
-    
-    /* Download Button Styling */
-    .stDownloadButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.5rem 2rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stDownloadButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 16px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Metric Widgets */
-    div[data-testid="stMetricValue"] {
-        font-size: clamp(1.2rem, 3vw, 2rem);
-        font-weight: 700;
-    }
-    
-    /* Responsive Tables */
-    .dataframe {
-        font-size: clamp(0.75rem, 1.5vw, 0.9rem);
-    }
-    
-    /* Footer Styling */
-    .footer {
-        text-align: center;
-        padding: 2rem 1rem;
-        background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
-        border-radius: 12px;
-        margin-top: 2rem;
-    }
-    
-    /* Expander Styling */
-    .streamlit-expanderHeader {
-        background-color: #f8f9ff;
-        border-radius: 8px;
-        font-weight: 600;
-    }
-    
-    /* Plot Containers */
-    .js-plotly-plot {
-        border-radius: 12px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.05);
-    }
-    
-    /* Radio Buttons */
-    .stRadio > label {
-        font-weight: 600;
-        color: #333;
-    }
-    
-    /* Select Boxes */
-    .stSelectbox > label {
-        font-weight: 600;
-        color: #333;
-    }
-    
-    /* Mobile Responsive */
-    @media (max-width: 640px) {
-        .stTabs [data-baseweb="tab"] {
-            font-size: 0.85rem;
-            padding: 8px 12px;
-        }
-        
-        .main-header {
-            font-size: 1.8rem;
-        }
-        
-        .sub-header {
-            font-size: 0.9rem;
-        }
-    }
-    
-    /* Smooth Animations */
-    * {
-        transition: background-color 0.2s ease, color 0.2s ease;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+STYLES_PATH = Path(__file__).resolve().parent / "styles.css"
+
 
+def _compact_css(css: str) -> str:
+    """Strip comments and collapse whitespace so less CSS is resent on each rerun"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
 
-@st.cache_data
-def load_data_cached(file_path: str):
-    """Cache data loading for better performance"""
+
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """Read and compact the stylesheet once per server process"""
+    return _compact_css(STYLES_PATH.read_text(encoding="utf-8"))
+
+
+# The element itself must be emitted on every full rerun, otherwise
+# Streamlit clears it from the page
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
+
+
+def _file_signature(file_path: str) -> tuple:
+    """Identify a file version by path, modification time and size"""
     try:
-        return load_solar_data(file_path)
+        return file_path, os.path.getmtime(file_path), os.path.getsize(file_path)
+    except OSError:
+        return file_path, None, None
+
+
+@st.cache_data(persist="disk", max_entries=8, show_spinner="Loading solar data...")
+def load_data_cached(file_path: str, signature: tuple):
+    """
+    Cache data loading for better performance
+    
+    The parsed frame is persisted to disk so app restarts skip CSV parsing;
+    `signature` (see `_file_signature`) invalidates the entry when the file changes.
+    A Parquet copy saved next to the CSV also survives cache clears.
+    """
+    try:
+        # Reads the Parquet copy when current, otherwise parses the CSV with Polars
+        df = load_solar_data(file_path, columns=DASHBOARD_COLUMNS)
+        return compact_dtypes(index_by_timestamp(df))
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return None
 
 
+@st.cache_data(max_entries=4, show_spinner="Parsing uploaded file...")
+def load_upload_cached(file_id: str, _uploaded_file) -> pd.DataFrame:
+    """
+    Parse an uploaded CSV once per upload
+    
+    `file_id` changes whenever a new file is uploaded, so reruns reuse the
+    parsed frame; `_uploaded_file` is not hashed.
+    """
+    data = _uploaded_file.getvalue()
+    try:
+        df = read_csv_polars(data, columns=DASHBOARD_COLUMNS)
+    except Exception:
+        # Columns that do not fit the Float32 schema: let pyarrow infer types
+        df = read_csv_columns(data, columns=DASHBOARD_COLUMNS)
+    return compact_dtypes(index_by_timestamp(df))
+
+
+@st.cache_data(show_spinner=False)
+def lttb_downsample(data_sig: tuple, _df: pd.DataFrame, metric: str, n_points: int = 2000) -> pd.DataFrame:
+    """
+    Cache the LTTB-reduced series plotted in the Time Series tab
+    
+    `data_sig` identifies the dataset and filter; `_df` is not hashed.
+    """
+    from src.plot_utils import downsample_lttb
+    return downsample_lttb(_df, metric, n_points)
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _cached_time_series(data_sig: tuple, _df: pd.DataFrame, metric: str):
+    """Cache the downsampled time-series figure per dataset signature and metric"""
+    from src.plot_utils import create_time_series
+    return create_time_series(lttb_downsample(data_sig, _df, metric), metric)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def to_csv_bytes(data_sig: tuple, _df: pd.DataFrame) -> bytes:
+    """
+    Serialize the filtered dataset to CSV once per dataset signature
+    
+    Uses Polars' multi-threaded writer; `_df` is not hashed. Each entry
+    holds a whole export and is shared by every session, so only the most
+    recent few are kept.
+    """
+    return pl.from_pandas(_df).write_csv(datetime_format='%Y-%m-%d %H:%M:%S').encode('utf-8')
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def to_parquet_bytes(data_sig: tuple, _df: pd.DataFrame) -> bytes:
+    """
+    Serialize the filtered dataset to snappy-compressed Parquet once per dataset signature
+    
+    Columnar and binary, so typically several times smaller and faster to
+    write than the CSV export; `_df` is not hashed. Bounded like
+    `to_csv_bytes`.
+    """
+    buffer = io.BytesIO()
+    pl.from_pandas(_df).write_parquet(buffer, compression='snappy')
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_summary(data_sig: tuple, _df: pd.DataFrame, metrics: tuple) -> pd.DataFrame:
+    """Cache the summary statistics table per dataset signature and metric selection"""
+    return get_summary_statistics(_df, list(metrics))
+
+
+@st.cache_data(show_spinner=False)
+def metric_stats(data_sig: tuple, _df: pd.DataFrame) -> dict:
+    """
+    Mean, max, min and standard deviation of every numeric column in one aggregation
+    
+    Shared by the Overview, Time Series and Detailed Analysis tabs so the
+    per-tab metric cards are dictionary lookups instead of column scans.
+    
+    Returns:
+        Dictionary mapping column name to {'mean', 'max', 'min', 'std'}
+    """
+    return _df.select_dtypes('number').agg(['mean', 'max', 'min', 'std']).to_dict()
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _cached_boxplot(data_sig: tuple, _df: pd.DataFrame, metrics: tuple, title: str):
+    """Cache the boxplot figure per dataset signature and metric selection"""
+    from src.plot_utils import create_boxplot
+    return create_boxplot(_df, list(metrics), title)
+
+
+@st.cache_data(show_spinner=False)
+def precompute_aggregates(data_sig: tuple, _df: pd.DataFrame) -> tuple:
+    """
+    Compute hourly means, monthly means and the correlation matrix once per dataset
+    
+    All available metrics are aggregated, so changing the metric selection
+    only slices the cached results.
+    
+    Returns:
+        Tuple of (hourly_agg, monthly_agg, corr_matrix)
+    """
+    metrics = get_available_metrics(_df)
+    return (
+        get_hourly_averages(_df, metrics),
+        get_monthly_averages(_df, metrics),
+        get_correlation_matrix(_df, metrics)
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _cached_correlation_heatmap(data_sig: tuple, _corr_matrix: pd.DataFrame, metrics: tuple):
+    """Cache the correlation heatmap per dataset signature and metric selection"""
+    from src.plot_utils import create_correlation_heatmap_from_matrix
+    return create_correlation_heatmap_from_matrix(_corr_matrix.loc[list(metrics), list(metrics)])
+
+
+@st.cache_data(show_spinner=False)
+def _cached_correlation_pairs(data_sig: tuple, _corr_matrix: pd.DataFrame, metrics: tuple) -> pd.DataFrame:
+    """
+    Cache the metric-pair correlation table, ordered by absolute correlation
+    
+    Returns:
+        DataFrame with 'Metric 1', 'Metric 2' and 'Correlation' columns
+    """
+    corr_matrix = _corr_matrix.loc[list(metrics), list(metrics)]
+    
+    # Upper triangle without the diagonal: each pair exactly once
+    values = corr_matrix.to_numpy()
+    iu, ju = np.triu_indices(values.shape[0], k=1)
+    corr_df = pd.DataFrame({
+        'Metric 1': corr_matrix.columns[iu],
+        'Metric 2': corr_matrix.columns[ju],
+        'Correlation': values[iu, ju]
+    })
+    return corr_df.sort_values('Correlation', ascending=False, key=abs)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_top_hours(data_sig: tuple, _df: pd.DataFrame, metric: str, top_n: int = 10) -> pd.DataFrame:
+    """Cache the peak-hours table per dataset signature and metric"""
+    return get_top_hours(_df, metric, top_n=top_n)
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _cached_hourly_pattern(data_sig: tuple, _hourly_agg: pd.DataFrame, metric: str):
+    """Cache the hourly pattern figure per dataset signature and metric"""
+    from src.plot_utils import create_hourly_pattern_from_agg
+    return create_hourly_pattern_from_agg(_hourly_agg, metric)
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _cached_monthly_pattern(data_sig: tuple, _monthly_agg: pd.DataFrame, metric: str):
+    """Cache the monthly pattern figure per dataset signature and metric"""
+    from src.plot_utils import create_monthly_pattern_from_agg
+    return create_monthly_pattern_from_agg(_monthly_agg, metric)
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _cached_distribution_plot(data_sig: tuple, _df: pd.DataFrame, metric: str):
+    """Cache the distribution figure per dataset signature and metric"""
+    from src.plot_utils import create_distribution_plot
+    return create_distribution_plot(_df, metric)
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _cached_wind_distribution(data_sig: tuple, _df: pd.DataFrame):
+    """Cache the wind speed/gust histogram per dataset signature"""
+    from src.plot_utils import create_wind_distribution
+    return create_wind_distribution(_df)
+
+
+def _progress_column(values: pd.Series, number_format: str):
+    """
+    Bar-style column scaled to `values`, rendered by the frontend
+    
+    Replaces pandas Styler gradients, which build per-cell CSS in Python
+    on every rerun.
+    """
+    low = min(0.0, float(values.min())) if values.notna().any() else 0.0
+    high = float(values.max()) if values.notna().any() else 1.0
+    if high <= low:
+        high = low + 1.0
+    return st.column_config.ProgressColumn(format=number_format, min_value=low, max_value=high)
+
+
+@st.fragment
+def _render_overview(df: pd.DataFrame, selected_metrics: list, data_sig: tuple):
+    """Overview tab: summary statistics, quick metrics and boxplot"""
+    st.header("📊 Overview & Summary Statistics")
+    
+    if not selected_metrics:
+        st.warning("⚠️ Please select at least one metric from the sidebar.")
+    else:
+        # Summary statistics with responsive layout
+        col1, col2 = st.columns([2, 1], gap="large")
+        
+        with col1:
+            st.markdown("### 📈 Statistical Summary")
+            summary_df = _cached_summary(data_sig, df, tuple(selected_metrics))
+            st.dataframe(
+                summary_df,
+                use_container_width=True,
+                height=400,
+                column_config={
+                    **{col: st.column_config.NumberColumn(format="%.2f") for col in summary_df.columns},
+                    'Mean': _progress_column(summary_df['Mean'], "%.2f")
+                }
+            )
+        
+        with col2:
+            st.markdown("### ⚡ Quick Metrics")
+            metrics_to_show = selected_metrics[:4] if len(selected_metrics) >= 4 else selected_metrics
+            stats = metric_stats(data_sig, df)
+            for metric in metrics_to_show:
+                if metric not in stats:
+                    continue
+                mean_val, max_val = stats[metric]['mean'], stats[metric]['max']
+                delta_pct = ((mean_val / max_val) * 100) if max_val != 0 else 0
+                st.metric(
+                    label=f"**{metric}**",
+                    value=f"{mean_val:.2f}",
+                    delta=f"{delta_pct:.1f}% of max",
+                    delta_color="normal"
+                )
+        
+        # Boxplot comparison with enhanced styling
+        st.markdown("---")
+        st.markdown("### 📊 Distribution Comparison")
+        st.markdown("*Compare the statistical distribution of selected metrics*")
+        fig_box = _cached_boxplot(data_sig, df, tuple(selected_metrics), "Metric Distribution Comparison")
+        st.plotly_chart(fig_box, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+
+
+@st.fragment
+def _render_time_series(df: pd.DataFrame, selected_metrics: list, data_sig: tuple):
+    """Time Series tab: downsampled trend, peak hours and key statistics"""
+    st.header("📈 Time Series Analysis")
+    
+    if not selected_metrics:
+        st.warning("⚠️ Please select at least one metric from the sidebar.")
+    else:
+        # Metric selector for time series
+        metric_for_ts = st.selectbox(
+            "Select metric for time series:",
+            selected_metrics,
+            help="Choose which metric to display over time"
+        )
+        
+        if metric_for_ts:
+            # Time series plot with enhanced presentation
+            st.markdown(f"### 📈 {metric_for_ts} Trends Over Time")
+            fig_ts = _cached_time_series(data_sig, df, metric_for_ts)
+            st.plotly_chart(fig_ts, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+            
+            # Top/Peak hours in columns
+            st.markdown("---")
+            col_left, col_right = st.columns([1, 1], gap="large")
+            
+            with col_left:
+                st.markdown(f"### 🏆 Top 10 Peak Hours")
+                top_df = _cached_top_hours(data_sig, df, metric_for_ts, top_n=10)
+                if not top_df.empty:
+                    st.dataframe(
+                        top_df,
+                        use_container_width=True,
+                        height=400,
+                        column_config={metric_for_ts: _progress_column(top_df[metric_for_ts], "%.2f")}
+                    )
+                else:
+                    st.info("No timestamp data available for peak hours analysis.")
+            
+            with col_right:
+                st.markdown("### 📊 Key Statistics")
+                stats = metric_stats(data_sig, df)
+                if metric_for_ts in stats:
+                    stats_container = st.container()
+                    with stats_container:
+                        metric_data = stats[metric_for_ts]
+                        st.metric("Maximum", f"{metric_data['max']:.2f}")
+                        st.metric("Average", f"{metric_data['mean']:.2f}")
+                        st.metric("Minimum", f"{metric_data['min']:.2f}")
+                        st.metric("Std Dev", f"{metric_data['std']:.2f}")
+
+
+@st.fragment
+def _render_detailed_analysis(df: pd.DataFrame, selected_metrics: list, data_sig: tuple):
+    """Detailed Analysis tab: distribution, scatter, bubble and wind views"""
+    from src.plot_utils import create_scatter_plot, create_bubble_chart
+    
+    st.header("🔍 Detailed Analysis")
+    
+    if not selected_metrics:
+        st.warning("⚠️ Please select at least one metric from the sidebar.")
+    else:
+        analysis_type = st.selectbox(
+            "Select analysis type:",
+            ["Distribution", "Scatter Plot", "Bubble Chart", "Wind Analysis"]
+        )
+        
+        if analysis_type == "Distribution":
+            metric = st.selectbox("Select metric:", selected_metrics, key="dist_metric")
+            st.markdown(f"### 📊 {metric} Distribution Analysis")
+            st.info("💡 This histogram shows how frequently different values occur in the dataset.")
+            fig = _cached_distribution_plot(data_sig, df, metric)
+            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+        
+        elif analysis_type == "Scatter Plot":
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                x_metric = st.selectbox("X-axis:", selected_metrics, key="scatter_x")
+            with col2:
+                y_metric = st.selectbox("Y-axis:", selected_metrics, index=min(1, len(selected_metrics)-1), key="scatter_y")
+            with col3:
+                color_option = st.selectbox("Color by:", ["None"] + selected_metrics, key="scatter_color")
+            
+            color_metric = None if color_option == "None" else color_option
+            st.markdown(f"### 🔵 Scatter Analysis: {y_metric} vs {x_metric}")
+            st.info("💡 Explore the relationship between two metrics. Points show individual measurements.")
+            fig = create_scatter_plot(df, x_metric, y_metric, color_metric)
+            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+        
+        elif analysis_type == "Bubble Chart":
+            if len(selected_metrics) < 3:
+                st.warning("⚠️ Please select at least 3 metrics for bubble chart.")
+            else:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    x_metric = st.selectbox("X-axis:", selected_metrics, key="bubble_x")
+                with col2:
+                    y_metric = st.selectbox("Y-axis:", selected_metrics, index=min(1, len(selected_metrics)-1), key="bubble_y")
+                with col3:
+                    size_metric = st.selectbox("Size:", selected_metrics, index=min(2, len(selected_metrics)-1), key="bubble_size")
+                
+                color_option = st.selectbox("Color by:", ["None"] + selected_metrics, key="bubble_color")
+                color_metric = None if color_option == "None" else color_option
+                
+                st.markdown("### 🫧 Multi-Dimensional Bubble Chart")
+                st.info("💡 Bubble size represents the third metric. Larger bubbles indicate higher values.")
+                fig = create_bubble_chart(df, x_metric, y_metric, size_metric, color_metric)
+                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+        
+        elif analysis_type == "Wind Analysis":
+            if 'WS' in df.columns:
+                st.markdown("### 🌬️ Wind Speed & Gust Analysis")
+                st.info("💡 Compare wind speed and gust distributions to understand wind patterns.")
+                fig = _cached_wind_distribution(data_sig, df)
+                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+                
+                # Additional wind statistics
+                stats = metric_stats(data_sig, df)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Avg Wind Speed", f"{stats['WS']['mean']:.2f} m/s")
+                with col2:
+                    st.metric("Max Wind Speed", f"{stats['WS']['max']:.2f} m/s")
+                with col3:
+                    if 'WSgust' in stats:
+                        st.metric("Max Gust", f"{stats['WSgust']['max']:.2f} m/s")
+            else:
+                st.warning("⚠️ Wind speed data (WS) not available in the dataset.")
+
+
+@st.fragment
+def _render_patterns(df: pd.DataFrame, selected_metrics: list, data_sig: tuple):
+    """Patterns tab: hourly and monthly averages"""
+    st.header("🌡️ Temporal Patterns")
+    
+    if not selected_metrics:
+        st.warning("⚠️ Please select at least one metric from the sidebar.")
+    elif 'Timestamp' not in df.columns:
+        st.warning("⚠️ Timestamp column not found in the dataset.")
+    else:
+        metric = st.selectbox("Select metric for pattern analysis:", selected_metrics, key="pattern_metric")
+        hourly_agg, monthly_agg, _ = precompute_aggregates(data_sig, df)
+        
+        pattern_type = st.radio(
+            "Pattern type:",
+            ["Hourly Pattern", "Monthly Pattern"],
+            horizontal=True
+        )
+        
+        if pattern_type == "Hourly Pattern":
+            st.markdown(f"### ⏰ Hourly Pattern: {metric}")
+            st.info("💡 This chart shows the average values across all days for each hour of the day.")
+            fig = _cached_hourly_pattern(data_sig, hourly_agg, metric)
+            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+        
+        else:  # Monthly Pattern
+            st.markdown(f"### 📅 Monthly Pattern: {metric}")
+            st.info("💡 This chart shows the average values for each month in the dataset.")
+            fig = _cached_monthly_pattern(data_sig, monthly_agg, metric)
+            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+
+
+@st.fragment
+def _render_correlations(df: pd.DataFrame, selected_metrics: list, data_sig: tuple):
+    """Correlations tab: heatmap and strongest metric pairs"""
+    st.header("🔗 Correlation Analysis")
+    
+    if len(selected_metrics) < 2:
+        st.warning("⚠️ Please select at least 2 metrics for correlation analysis.")
+    else:
+        st.markdown("### 🔗 Correlation Matrix Heatmap")
+        st.info("💡 Correlation values range from -1 to 1. Values closer to 1 indicate strong positive correlation, while values closer to -1 indicate strong negative correlation.")
+        _, _, corr_all = precompute_aggregates(data_sig, df)
+        fig_corr = _cached_correlation_heatmap(data_sig, corr_all, tuple(selected_metrics))
+        st.plotly_chart(fig_corr, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+        
+        # Show strongest correlations
+        st.markdown("---")
+        st.markdown("### 🎯 Key Correlations")
+        corr_df = _cached_correlation_pairs(data_sig, corr_all, tuple(selected_metrics))
+        
+        if not corr_df.empty:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("#### 🔺 Strongest Positive")
+                st.dataframe(
+                    corr_df.head(5),
+                    use_container_width=True,
+                    column_config=CORRELATION_COLUMN_CONFIG
+                )
+            with col2:
+                st.markdown("#### 🔻 Strongest Negative")
+                st.dataframe(
+                    corr_df.tail(5),
+                    use_container_width=True,
+                    column_config=CORRELATION_COLUMN_CONFIG
+                )
+
+
+@st.fragment
+def _render_data_table(df: pd.DataFrame, selected_metrics: list, data_sig: tuple):
+    """Data Table tab: raw data preview and CSV export"""
+    st.header("📋 Raw Data Table")
+    
+    st.markdown("### 📊 Dataset Preview")
+    st.info("💡 Explore your data directly. Use the controls below to customize the view.")
+    
+    # Display controls with better spacing
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        num_rows = st.slider("Number of rows to display:", 5, 100, 20)
+    with col2:
+        show_all_cols = st.checkbox(
+            "Show all metrics", value=False,
+            help="Include the metrics not selected in the sidebar"
+        )
+    with col3:
+        st.metric("Total Rows", f"{len(df):,}")
+    
+    # Display data, projected to the selected columns unless the user opts in
+    display_cols = ['Timestamp'] + selected_metrics if 'Timestamp' in df.columns else selected_metrics
+    display_cols = [col for col in display_cols if col in df.columns]
+    
+    if show_all_cols:
+        display_cols = list(df.columns)
+    
+    # Slice rows first so the column projection only copies the preview
+    st.dataframe(df.head(num_rows).loc[:, display_cols], use_container_width=True, hide_index=True)
+    
+    # Download option with enhanced presentation
+    st.markdown("---")
+    st.markdown("### 📥 Export Data")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.markdown("""
+        Download the filtered dataset in CSV or Parquet format for further analysis.
+        This includes all currently selected metrics and applied filters.
+        """)
+    with col2:
+        # Serialized only when clicked (runs off the script thread)
+        # One stamp per filtered dataset: the file name is part of the button's
+        # identity, so a per-second stamp would remount it on every rerun
+        export_stamps = st.session_state.setdefault('export_stamps', {})
+        if data_sig not in export_stamps:
+            export_stamps[data_sig] = time.strftime('%Y%m%d_%H%M%S')
+        file_stem = f"solar_data_filtered_{export_stamps[data_sig]}"
+        st.download_button(
+            label="⬇️ Download CSV",
+            data=lambda: to_csv_bytes(data_sig, df),
+            file_name=f"{file_stem}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+        st.download_button(
+            label="⬇️ Download Parquet",
+            data=lambda: to_parquet_bytes(data_sig, df),
+            file_name=f"{file_stem}.parquet",
+            mime="application/vnd.apache.parquet",
+            use_container_width=True
+        )
+
+
 def main():
     """Main application function"""
     
@@ -257,6 +629,7 @@ def main():
     )
     
     df = None
+    source_sig = None
     
     if data_source == "Upload CSV File":
         uploaded_file = st.sidebar.file_uploader(
@@ -267,9 +640,14 @@ def main():
         
         if uploaded_file is not None:
             try:
-                df = pd.read_csv(uploaded_file)
-                if 'Timestamp' in df.columns:
-                    df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
+                upload_sig = ('upload', uploaded_file.file_id)
+                # Reuse this session's frame; a cache hit would still unpickle a copy
+                stored = st.session_state.get('uploaded_dataset')
+                if stored is None or stored[0] != upload_sig:
+                    st.session_state['uploaded_dataset'] = (
+                        upload_sig, load_upload_cached(uploaded_file.file_id, uploaded_file)
+                    )
+                source_sig, df = st.session_state['uploaded_dataset']
                 st.sidebar.success("✅ File loaded successfully!")
             except Exception as e:
                 st.sidebar.error(f"❌ Error loading file: {str(e)}")
@@ -304,9 +682,18 @@ def main():
         
         if file_path:
             if st.sidebar.button("📂 Load Data"):
-                df = load_data_cached(file_path)
-                if df is not None:
+                file_sig = _file_signature(file_path)
+                loaded = load_data_cached(file_path, file_sig)
+                if loaded is not None:
+                    # Kept across reruns; the button is only True on the click itself
+                    st.session_state['local_dataset'] = (file_sig, loaded)
                     st.sidebar.success("✅ Data loaded successfully!")
+        
+        # Only for the path currently in the sidebar: picking another country
+        # or editing the path shows the empty state until Load Data is clicked
+        stored = st.session_state.get('local_dataset')
+        if file_path and stored is not None and stored[0][0] == file_path:
+            source_sig, df = stored
     
     # Main content area
     if df is None:
@@ -355,7 +742,13 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.subheader("📊 Select Metrics")
     
-    available_metrics = get_available_metrics(df)
+    # Derived once per loaded dataset and reused across reruns
+    if st.session_state.get('dataset_sig') != source_sig:
+        st.session_state['dataset_sig'] = source_sig
+        st.session_state['available_metrics'] = get_available_metrics(df)
+        st.session_state['date_range'] = get_date_range(df)
+    
+    available_metrics = st.session_state['available_metrics']
     
     if not available_metrics:
         st.error("❌ No valid metrics found in the dataset!")
@@ -373,7 +766,8 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.subheader("📅 Date Range Filter")
     
-    min_date, max_date = get_date_range(df)
+    min_date, max_date = st.session_state['date_range']
+    date_filter = None
     
     if min_date and max_date:
         use_date_filter = st.sidebar.checkbox("Enable date filter", value=False)
@@ -387,16 +781,21 @@ def main():
             )
             
             if len(date_range) == 2:
+                date_filter = tuple(date_range)
                 df = filter_by_date_range(df, date_range[0], date_range[1])
                 st.sidebar.info(f"📊 Filtered to {len(df):,} records")
     
+    # Cheap cache key for derived results: the source file plus the applied filter
+    data_sig = (source_sig, date_filter)
+    
     # Display basic dataset info
     st.sidebar.markdown("---")
     st.sidebar.subheader("ℹ️ Dataset Info")
-    st.sidebar.write(f"**Records**: {len(df):,}")
-    st.sidebar.write(f"**Columns**: {len(df.columns)}")
+    # One markdown element instead of a separate delta per line
+    info_lines = [f"**Records**: {len(df):,}", f"**Columns**: {len(df.columns)}"]
     if min_date and max_date:
-        st.sidebar.write(f"**Date Range**: {min_date.date()} to {max_date.date()}")
+        info_lines.append(f"**Date Range**: {min_date.date()} to {max_date.date()}")
+    st.sidebar.markdown("  \n".join(info_lines))
     
     # Main dashboard content with tabs
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
@@ -409,277 +808,22 @@ def main():
     ])
     
     with tab1:
-        st.header("📊 Overview & Summary Statistics")
-        
-        if not selected_metrics:
-            st.warning("⚠️ Please select at least one metric from the sidebar.")
-        else:
-            # Summary statistics with responsive layout
-            col1, col2 = st.columns([2, 1], gap="large")
-            
-            with col1:
-                st.markdown("### 📈 Statistical Summary")
-                summary_df = get_summary_statistics(df, selected_metrics)
-                st.dataframe(
-                    summary_df.style.format("{:.2f}").background_gradient(cmap='Blues', subset=['Mean']),
-                    use_container_width=True,
-                    height=400
-                )
-            
-            with col2:
-                st.markdown("### ⚡ Quick Metrics")
-                metrics_to_show = selected_metrics[:4] if len(selected_metrics) >= 4 else selected_metrics
-                for metric in metrics_to_show:
-                    if metric in df.columns:
-                        mean_val = df[metric].mean()
-                        max_val = df[metric].max()
-                        delta_pct = ((mean_val / max_val) * 100) if max_val != 0 else 0
-                        st.metric(
-                            label=f"**{metric}**",
-                            value=f"{mean_val:.2f}",
-                            delta=f"{delta_pct:.1f}% of max",
-                            delta_color="normal"
-                        )
-            
-            # Boxplot comparison with enhanced styling
-            st.markdown("---")
-            st.markdown("### 📊 Distribution Comparison")
-            st.markdown("*Compare the statistical distribution of selected metrics*")
-            fig_box = create_boxplot(df, selected_metrics, "Metric Distribution Comparison")
-            st.plotly_chart(fig_box, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+        _render_overview(df, selected_metrics, data_sig)
     
     with tab2:
-        st.header("📈 Time Series Analysis")
-        
-        if not selected_metrics:
-            st.warning("⚠️ Please select at least one metric from the sidebar.")
-        else:
-            # Metric selector for time series
-            metric_for_ts = st.selectbox(
-                "Select metric for time series:",
-                selected_metrics,
-                help="Choose which metric to display over time"
-            )
-            
-            if metric_for_ts:
-                # Time series plot with enhanced presentation
-                st.markdown(f"### 📈 {metric_for_ts} Trends Over Time")
-                fig_ts = create_time_series(df, metric_for_ts)
-                st.plotly_chart(fig_ts, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
-                
-                # Top/Peak hours in columns
-                st.markdown("---")
-                col_left, col_right = st.columns([1, 1], gap="large")
-                
-                with col_left:
-                    st.markdown(f"### 🏆 Top 10 Peak Hours")
-                    top_df = get_top_hours(df, metric_for_ts, top_n=10)
-                    if not top_df.empty:
-                        st.dataframe(
-                            top_df.style.format({metric_for_ts: "{:.2f}"}).highlight_max(axis=0, color='lightgreen'),
-                            use_container_width=True,
-                            height=400
-                        )
-                    else:
-                        st.info("No timestamp data available for peak hours analysis.")
-                
-                with col_right:
-                    st.markdown("### 📊 Key Statistics")
-                    if metric_for_ts in df.columns:
-                        stats_container = st.container()
-                        with stats_container:
-                            metric_data = df[metric_for_ts].dropna()
-                            st.metric("Maximum", f"{metric_data.max():.2f}")
-                            st.metric("Average", f"{metric_data.mean():.2f}")
-                            st.metric("Minimum", f"{metric_data.min():.2f}")
-                            st.metric("Std Dev", f"{metric_data.std():.2f}")
+        _render_time_series(df, selected_metrics, data_sig)
     
     with tab3:
-        st.header("🔍 Detailed Analysis")
-        
-        if not selected_metrics:
-            st.warning("⚠️ Please select at least one metric from the sidebar.")
-        else:
-            analysis_type = st.selectbox(
-                "Select analysis type:",
-                ["Distribution", "Scatter Plot", "Bubble Chart", "Wind Analysis"]
-            )
-            
-            if analysis_type == "Distribution":
-                metric = st.selectbox("Select metric:", selected_metrics, key="dist_metric")
-                st.markdown(f"### 📊 {metric} Distribution Analysis")
-                st.info("💡 This histogram shows how frequently different values occur in the dataset.")
-                fig = create_distribution_plot(df, metric)
-                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
-            
-            elif analysis_type == "Scatter Plot":
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    x_metric = st.selectbox("X-axis:", selected_metrics, key="scatter_x")
-                with col2:
-                    y_metric = st.selectbox("Y-axis:", selected_metrics, index=min(1, len(selected_metrics)-1), key="scatter_y")
-                with col3:
-                    color_option = st.selectbox("Color by:", ["None"] + selected_metrics, key="scatter_color")
-                
-                color_metric = None if color_option == "None" else color_option
-                st.markdown(f"### 🔵 Scatter Analysis: {y_metric} vs {x_metric}")
-                st.info("💡 Explore the relationship between two metrics. Points show individual measurements.")
-                fig = create_scatter_plot(df, x_metric, y_metric, color_metric)
-                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
-            
-            elif analysis_type == "Bubble Chart":
-                if len(selected_metrics) < 3:
-                    st.warning("⚠️ Please select at least 3 metrics for bubble chart.")
-                else:
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        x_metric = st.selectbox("X-axis:", selected_metrics, key="bubble_x")
-                    with col2:
-                        y_metric = st.selectbox("Y-axis:", selected_metrics, index=min(1, len(selected_metrics)-1), key="bubble_y")
-                    with col3:
-                        size_metric = st.selectbox("Size:", selected_metrics, index=min(2, len(selected_metrics)-1), key="bubble_size")
-                    
-                    color_option = st.selectbox("Color by:", ["None"] + selected_metrics, key="bubble_color")
-                    color_metric = None if color_option == "None" else color_option
-                    
-                    st.markdown("### 🫧 Multi-Dimensional Bubble Chart")
-                    st.info("💡 Bubble size represents the third metric. Larger bubbles indicate higher values.")
-                    fig = create_bubble_chart(df, x_metric, y_metric, size_metric, color_metric)
-                    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
-            
-            elif analysis_type == "Wind Analysis":
-                if 'WS' in df.columns:
-                    st.markdown("### 🌬️ Wind Speed & Gust Analysis")
-                    st.info("💡 Compare wind speed and gust distributions to understand wind patterns.")
-                    fig = create_wind_distribution(df)
-                    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
-                    
-                    # Additional wind statistics
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Avg Wind Speed", f"{df['WS'].mean():.2f} m/s")
-                    with col2:
-                        st.metric("Max Wind Speed", f"{df['WS'].max():.2f} m/s")
-                    with col3:
-                        if 'WSgust' in df.columns:
-                            st.metric("Max Gust", f"{df['WSgust'].max():.2f} m/s")
-                else:
-                    st.warning("⚠️ Wind speed data (WS) not available in the dataset.")
+        _render_detailed_analysis(df, selected_metrics, data_sig)
     
     with tab4:
-        st.header("🌡️ Temporal Patterns")
-        
-        if not selected_metrics:
-            st.warning("⚠️ Please select at least one metric from the sidebar.")
-        elif 'Timestamp' not in df.columns:
-            st.warning("⚠️ Timestamp column not found in the dataset.")
-        else:
-            metric = st.selectbox("Select metric for pattern analysis:", selected_metrics, key="pattern_metric")
-            
-            pattern_type = st.radio(
-                "Pattern type:",
-                ["Hourly Pattern", "Monthly Pattern"],
-                horizontal=True
-            )
-            
-            if pattern_type == "Hourly Pattern":
-                st.markdown(f"### ⏰ Hourly Pattern: {metric}")
-                st.info("💡 This chart shows the average values across all days for each hour of the day.")
-                fig = create_hourly_pattern(df, metric)
-                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
-            
-            else:  # Monthly Pattern
-                st.markdown(f"### 📅 Monthly Pattern: {metric}")
-                st.info("💡 This chart shows the average values for each month in the dataset.")
-                fig = create_monthly_pattern(df, metric)
-                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
+        _render_patterns(df, selected_metrics, data_sig)
     
     with tab5:
-        st.header("🔗 Correlation Analysis")
-        
-        if len(selected_metrics) < 2:
-            st.warning("⚠️ Please select at least 2 metrics for correlation analysis.")
-        else:
-            st.markdown("### 🔗 Correlation Matrix Heatmap")
-            st.info("💡 Correlation values range from -1 to 1. Values closer to 1 indicate strong positive correlation, while values closer to -1 indicate strong negative correlation.")
-            fig_corr = create_correlation_heatmap(df, selected_metrics)
-            st.plotly_chart(fig_corr, use_container_width=True, config={'displayModeBar': True, 'displaylogo': False})
-            
-            # Show strongest correlations
-            st.markdown("---")
-            st.markdown("### 🎯 Key Correlations")
-            corr_matrix = df[selected_metrics].corr()
-            
-            # Get top correlations
-            correlations = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    correlations.append({
-                        'Metric 1': corr_matrix.columns[i],
-                        'Metric 2': corr_matrix.columns[j],
-                        'Correlation': corr_matrix.iloc[i, j]
-                    })
-            
-            if correlations:
-                corr_df = pd.DataFrame(correlations)
-                corr_df = corr_df.sort_values('Correlation', ascending=False, key=abs)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("#### 🔺 Strongest Positive")
-                    st.dataframe(
-                        corr_df.head(5).style.format({'Correlation': '{:.3f}'}).background_gradient(cmap='Greens'),
-                        use_container_width=True
-                    )
-                with col2:
-                    st.markdown("#### 🔻 Strongest Negative")
-                    st.dataframe(
-                        corr_df.tail(5).style.format({'Correlation': '{:.3f}'}).background_gradient(cmap='Reds'),
-                        use_container_width=True
-                    )
+        _render_correlations(df, selected_metrics, data_sig)
     
     with tab6:
-        st.header("📋 Raw Data Table")
-        
-        st.markdown("### 📊 Dataset Preview")
-        st.info("💡 Explore your data directly. Use the controls below to customize the view.")
-        
-        # Display controls with better spacing
-        col1, col2, col3 = st.columns([2, 2, 1])
-        with col1:
-            num_rows = st.slider("Number of rows to display:", 5, 100, 20)
-        with col2:
-            show_all_cols = st.checkbox("Show all columns", value=False)
-        with col3:
-            st.metric("Total Rows", f"{len(df):,}")
-        
-        # Display data
-        if show_all_cols:
-            st.dataframe(df.head(num_rows), use_container_width=True)
-        else:
-            display_cols = ['Timestamp'] + selected_metrics if 'Timestamp' in df.columns else selected_metrics
-            display_cols = [col for col in display_cols if col in df.columns]
-            st.dataframe(df[display_cols].head(num_rows), use_container_width=True)
-        
-        # Download option with enhanced presentation
-        st.markdown("---")
-        st.markdown("### 📥 Export Data")
-        
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.markdown("""
-            Download the filtered dataset in CSV format for further analysis.
-            This includes all currently selected metrics and applied filters.
-            """)
-        with col2:
-            csv = df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="⬇️ Download CSV",
-                data=csv,
-                file_name=f"solar_data_filtered_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
+        _render_data_table(df, selected_metrics, data_sig)
     
     # Enhanced Footer
     st.markdown("---")
@@ -4,11 +4,34 @@ Provides functions to load and validate solar dataset CSV files
 """
 
 import pandas as pd
+import numpy as np
+import polars as pl
+import polars.selectors as cs
+import narwhals as nw
+import io
+import json
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional, Tuple
 
 
+# Common solar metrics
+POTENTIAL_METRICS = ['GHI', 'DNI', 'DHI', 'Tamb', 'RH', 'WS', 'WSgust', 
+                     'ModA', 'ModB', 'BP', 'Precipitation']
+
+# Columns the dashboard reads; auxiliary ones (WD, TModA, Comments, ...) are skipped
+DASHBOARD_COLUMNS = ['Timestamp'] + POTENTIAL_METRICS
+
+# Parquet copies record the CSV they were made from under this metadata key;
+# bump the version whenever the stored layout or parsing rules change
+SIDECAR_METADATA_KEY = b'solar_challenge.source'
+SIDECAR_FORMAT_VERSION = 1
+
+# Elements per block in the summary-statistics pass (512 KiB of float64)
+STATS_BLOCK_ROWS = 65_536
+
+
 def validate_file_path(file_path: str) -> Tuple[bool, str]:
     """
     Validate if the file exists and is a CSV file
@@ -36,13 +59,20 @@ def validate_file_path(file_path: str) -> Tuple[bool, str]:
     return True, ""
 
 
-def load_solar_data(file_path: str, parse_dates: bool = True) -> Optional[pd.DataFrame]:
+def load_solar_data(file_path: str, parse_dates: bool = True,
+                    columns: Optional[list] = None) -> Optional[pd.DataFrame]:
     """
     Load solar dataset from CSV file with proper parsing
     
+    With parse_dates enabled, a Parquet copy saved next to the CSV (see
+    `read_parquet_sidecar`) is used when it is up to date and holds the
+    requested columns, and written after the CSV has been parsed otherwise.
+    Only `columns` are parsed, so that copy may hold just those.
+    
     Args:
         file_path: Path to the CSV file
         parse_dates: Whether to parse the Timestamp column as datetime
+        columns: Columns to load (optional); names missing from the file are skipped
         
     Returns:
         DataFrame with solar data, or None if loading fails
@@ -53,12 +83,36 @@ def load_solar_data(file_path: str, parse_dates: bool = True) -> Optional[pd.Dat
         raise FileNotFoundError(error_msg)
     
     try:
-        # Load the CSV file
-        df = pd.read_csv(file_path)
+        # The sidecar stores parsed timestamps, so it only serves parsed loads
+        if parse_dates:
+            df = read_parquet_sidecar(file_path, columns=columns)
+            if df is not None:
+                return df
+        
+        # Taken before parsing, so a CSV changed mid-parse leaves the copy stale
+        source_key = _sidecar_source_key(file_path)
+        
+        # Polars' multi-threaded reader first; columns that do not fit its
+        # Float32 metric schema fall back to the pandas readers
+        try:
+            df = read_csv_polars(file_path, parse_dates=parse_dates, columns=columns)
+        except Exception:
+            # The Arrow engine also recognises ISO timestamps while parsing
+            read_options = {} if parse_dates else {'dtype': {'Timestamp': str}}
+            df = read_csv_columns(file_path, columns=columns, **read_options)
         
         # Parse timestamp if it exists and parse_dates is True
-        if parse_dates and 'Timestamp' in df.columns:
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
+        if parse_dates and 'Timestamp' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['Timestamp']):
+            df['Timestamp'] = parse_timestamps(df['Timestamp'])
+        
+        df = categorize_strings(df)
+        
+        # Later loads asking for these columns (or fewer) read the copy instead
+        if parse_dates:
+            write_parquet_sidecar(df, file_path, source_key=source_key, columns=columns)
+        
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
         
         return df
     
@@ -66,6 +120,282 @@ def load_solar_data(file_path: str, parse_dates: bool = True) -> Optional[pd.Dat
         raise Exception(f"Error loading CSV file: {str(e)}")
 
 
+def read_csv_polars(source, parse_dates: bool = True, columns: Optional[list] = None) -> pd.DataFrame:
+    """
+    Parse a CSV with Polars' multi-threaded reader and hand back a pandas DataFrame
+    
+    Args:
+        source: File path or raw CSV bytes
+        parse_dates: Whether to parse the Timestamp column as datetime (see `parse_timestamps`)
+        columns: Columns to read (optional); names missing from the file are skipped
+        
+    Returns:
+        DataFrame with NumPy-backed columns
+    """
+    # Known metrics are typed up front, skipping inference and landing as float32.
+    # Timestamp stays text: Polars' date guessing reads ambiguous dates day-first
+    schema = {metric: pl.Float32 for metric in POTENTIAL_METRICS}
+    schema['Timestamp'] = pl.String
+    
+    if columns is None:
+        df = pl.read_csv(source, schema_overrides=schema).to_pandas()
+    else:
+        # The lazy reader pushes the projection down, so unused columns are never parsed
+        df = (
+            pl.scan_csv(source, schema_overrides=schema)
+            .select(cs.by_name(*columns, require_all=False))
+            .collect()
+            .to_pandas()
+        )
+    
+    if parse_dates and 'Timestamp' in df.columns:
+        df['Timestamp'] = parse_timestamps(df['Timestamp'])
+    
+    return df
+
+
+def read_csv_columns(source, columns: Optional[list] = None, **read_options) -> pd.DataFrame:
+    """
+    Parse a CSV with pandas' Arrow engine, keeping only the requested columns
+    
+    The Arrow engine only takes `usecols` as an explicit list, so the header
+    is read first and filtered to the columns present. The C engine is used
+    if the Arrow engine is unavailable or rejects the options.
+    
+    Args:
+        source: File path or raw CSV bytes
+        columns: Columns to read (optional); names missing from the file are skipped
+        **read_options: Extra pd.read_csv arguments (e.g. dtype)
+        
+    Returns:
+        DataFrame with the columns in file order
+    """
+    def open_source():
+        return io.BytesIO(source) if isinstance(source, bytes) else source
+    
+    if columns is not None:
+        wanted = set(columns)
+        header = pd.read_csv(open_source(), nrows=0).columns
+        read_options['usecols'] = [col for col in header if col in wanted]
+    
+    try:
+        return pd.read_csv(open_source(), engine='pyarrow', **read_options)
+    except (ImportError, ValueError):
+        return pd.read_csv(open_source(), **read_options)
+
+
+def parquet_sidecar_path(file_path: str) -> Path:
+    """
+    Location of the Parquet copy kept next to a CSV file
+    
+    The full file name is kept (data.csv -> data.csv.parquet), so the copy
+    never shadows a user's own data.parquet or another file with the same stem.
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        Path of the file name with '.parquet' appended
+    """
+    return Path(str(file_path) + '.parquet')
+
+
+def _sidecar_source_key(file_path: str) -> dict:
+    """
+    Identity of a CSV file as recorded in its Parquet copy
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        Dict with the sidecar format version and the CSV's size and mtime
+    """
+    stat = os.stat(file_path)
+    return {'version': SIDECAR_FORMAT_VERSION, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def read_parquet_sidecar(file_path: str, columns: Optional[list] = None) -> Optional[pd.DataFrame]:
+    """
+    Load the Parquet copy of a CSV file if it was made from the CSV as it is now
+    
+    Parquet is typed and columnar, so this skips tokenizing and
+    re-parsing timestamps on every cold start. The copy is only used when
+    the CSV's size and mtime equal the ones stored in it, so a CSV replaced
+    by an older file (unzip, cp -p) is parsed again too, and when it was
+    written by a load asking for at least the requested columns.
+    
+    Args:
+        file_path: Path to the CSV file
+        columns: Columns to read (optional); names missing from the file are skipped
+        
+    Returns:
+        DataFrame, or None if the sidecar is missing, stale, lacks columns or is unreadable
+    """
+    sidecar = parquet_sidecar_path(file_path)
+    
+    try:
+        import pyarrow.parquet as pq
+        schema = pq.read_schema(sidecar)
+        stored_key = json.loads((schema.metadata or {}).get(SIDECAR_METADATA_KEY, b'null'))
+        if not isinstance(stored_key, dict):
+            return None
+        # None when the copy holds every column of the CSV
+        projection = stored_key.pop('columns', None)
+        if stored_key != _sidecar_source_key(file_path):
+            return None
+        if projection is not None and (columns is None or not set(columns) <= set(projection)):
+            return None
+        if columns is not None:
+            stored = set(schema.names)
+            columns = [col for col in columns if col in stored]
+        return pd.read_parquet(sidecar, engine='pyarrow', columns=columns)
+    except (OSError, ValueError, ImportError):
+        return None
+
+
+def write_parquet_sidecar(df: pd.DataFrame, file_path: str,
+                          source_key: Optional[dict] = None,
+                          columns: Optional[list] = None) -> bool:
+    """
+    Save a parsed dataset as a snappy-compressed Parquet copy next to its CSV
+    
+    The file is written under a unique temporary name and moved into place,
+    so concurrent writers and readers never see a partial file. Failures
+    (e.g. a read-only data folder) are not fatal; the CSV is simply parsed
+    again next time.
+    
+    Args:
+        df: Parsed solar dataset DataFrame
+        file_path: Path to the CSV file the data was read from
+        source_key: CSV identity taken before parsing (see `_sidecar_source_key`);
+            defaults to the CSV's current one
+        columns: Columns the load asked for, or None if `df` holds the whole CSV
+        
+    Returns:
+        True if the sidecar was written
+    """
+    sidecar = parquet_sidecar_path(file_path)
+    tmp_path = None
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        if source_key is None:
+            source_key = _sidecar_source_key(file_path)
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        stored_key = dict(source_key, columns=None if columns is None else sorted(set(columns)))
+        metadata[SIDECAR_METADATA_KEY] = json.dumps(stored_key).encode()
+        
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{sidecar.name}.", suffix='.tmp', dir=sidecar.parent)
+        os.close(fd)
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression='snappy')
+        os.replace(tmp_path, sidecar)
+        return True
+    except (OSError, ValueError, ImportError):
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return False
+
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Convert timestamp strings to datetimes, trying the ISO 8601 fast path first
+    
+    An explicit format skips pandas' per-value format inference; mixed or
+    malformed values fall back to inference with unparseable entries as NaT.
+    
+    Args:
+        values: Series of timestamp strings
+        
+    Returns:
+        Series of datetime64 values
+    """
+    try:
+        return pd.to_datetime(values, format='ISO8601')
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, errors='coerce')
+
+
+def index_by_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parse, sort and index the dataset by its Timestamp column
+    
+    The Timestamp column is kept; the sorted DatetimeIndex alongside it lets
+    date-range filters slice by binary search instead of a full boolean mask.
+    
+    Args:
+        df: Solar dataset DataFrame
+        
+    Returns:
+        DataFrame sorted by Timestamp with a matching DatetimeIndex
+    """
+    if 'Timestamp' not in df.columns:
+        return df
+    
+    if not pd.api.types.is_datetime64_any_dtype(df['Timestamp']):
+        df['Timestamp'] = parse_timestamps(df['Timestamp'])
+    
+    df = df.dropna(subset=['Timestamp']).sort_values('Timestamp').reset_index(drop=True)
+    # Unnamed so 'Timestamp' stays an unambiguous column label
+    df.index = pd.DatetimeIndex(df['Timestamp']).rename(None)
+    
+    return df
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink the in-memory representation of the dataset
+    
+    Measurements are downcast to float32 (ample precision for W/m², °C, %)
+    and integers to the smallest fitting type, halving memory and the bytes
+    shipped to the browser. Repetitive string columns become categoricals
+    (see `categorize_strings`), which also serialize to Arrow much faster
+    for st.dataframe.
+    
+    Args:
+        df: Solar dataset DataFrame
+        
+    Returns:
+        DataFrame with compacted dtypes
+    """
+    float_cols = df.select_dtypes(include=['float64']).columns
+    if len(float_cols):
+        df[float_cols] = df[float_cols].astype('float32')
+    
+    for col in df.select_dtypes(include=['int64']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    return categorize_strings(df)
+
+
+def categorize_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert repetitive string columns (e.g. Comments) to categoricals
+    
+    Categoricals store each distinct value once plus small integer codes,
+    so they take a fraction of the memory of object strings and group and
+    compare on the codes.
+    
+    Args:
+        df: Solar dataset DataFrame
+        
+    Returns:
+        DataFrame with low-cardinality string columns as category dtype
+    """
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        # Categoricals only pay off when values repeat
+        if df[col].nunique() <= len(df) // 2:
+            df[col] = df[col].astype('category')
+    
+    return df
+
+
 def get_available_metrics(df: pd.DataFrame) -> list:
     """
     Get list of available numeric metrics from the dataframe
@@ -76,12 +406,8 @@ def get_available_metrics(df: pd.DataFrame) -> list:
     Returns:
         List of metric column names
     """
-    # Common solar metrics
-    potential_metrics = ['GHI', 'DNI', 'DHI', 'Tamb', 'RH', 'WS', 'WSgust', 
-                        'ModA', 'ModB', 'BP', 'Precipitation']
-    
     # Filter to only columns that exist in the dataframe
-    available = [col for col in potential_metrics if col in df.columns]
+    available = [col for col in POTENTIAL_METRICS if col in df.columns]
     
     return available
 
@@ -99,6 +425,10 @@ def get_date_range(df: pd.DataFrame) -> Tuple[Optional[pd.Timestamp], Optional[p
     if 'Timestamp' not in df.columns:
         return None, None
     
+    # Frames from index_by_timestamp are sorted, so the ends are the range
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.is_monotonic_increasing and len(df) > 0:
+        return df.index[0], df.index[-1]
+    
     try:
         min_date = df['Timestamp'].min()
         max_date = df['Timestamp'].max()
@@ -122,12 +452,91 @@ def filter_by_date_range(df: pd.DataFrame, start_date, end_date) -> pd.DataFrame
     if 'Timestamp' not in df.columns:
         return df
     
-    mask = (df['Timestamp'] >= pd.to_datetime(start_date)) & \
-           (df['Timestamp'] <= pd.to_datetime(end_date))
+    start, end = pd.to_datetime(start_date), pd.to_datetime(end_date)
+    
+    # Frames prepared by index_by_timestamp slice in O(log n)
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.is_monotonic_increasing:
+        return df.loc[start:end]
+    
+    # A sorted column without that index: binary search, no mask allocation
+    timestamps = df['Timestamp']
+    if pd.api.types.is_datetime64_any_dtype(timestamps) and timestamps.is_monotonic_increasing:
+        lo = timestamps.searchsorted(start, side='left')
+        hi = timestamps.searchsorted(end, side='right')
+        return df.iloc[lo:hi]
+    
+    mask = (df['Timestamp'] >= start) & (df['Timestamp'] <= end)
     
     return df[mask]
 
 
+def _block_moments(values: np.ndarray, block: int = STATS_BLOCK_ROWS) -> Tuple[float, float, float, float]:
+    """
+    Mean, sample std, min and max of a NaN-free array in one pass over memory
+    
+    Each cache-sized block is reduced on its own and merged with Chan et al.'s
+    parallel form of Welford's update, so the column is streamed from RAM
+    once while the variance stays numerically stable.
+    
+    Args:
+        values: Non-empty float64 array without NaN
+        block: Number of elements reduced per block
+        
+    Returns:
+        Tuple of (mean, std, min, max); std is NaN for a single value
+    """
+    n, mean, m2 = 0, 0.0, 0.0
+    low, high = np.inf, -np.inf
+    
+    for start in range(0, values.size, block):
+        chunk = values[start:start + block]
+        n_b = chunk.size
+        mean_b = chunk.mean()
+        dev = chunk - mean_b
+        
+        delta = mean_b - mean
+        total = n + n_b
+        mean += delta * n_b / total
+        m2 += np.dot(dev, dev) + delta * delta * n * n_b / total
+        n = total
+        
+        low = min(low, chunk.min())
+        high = max(high, chunk.max())
+    
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    
+    return mean, std, low, high
+
+
+def _column_summary(values: np.ndarray) -> list:
+    """
+    Mean, median, sample std, min, max and count of one column, ignoring NaN
+    
+    Missing values are dropped once up front; the moments then come from a
+    single blocked pass and the median from an in-place partial sort.
+    
+    Args:
+        values: Column values as a float64 NumPy array
+        
+    Returns:
+        List of [mean, median, std, min, max, count]
+    """
+    # Boolean indexing copies, so the partition below cannot touch the caller's data
+    values = values[~np.isnan(values)]
+    n = values.size
+    
+    if n == 0:
+        return [np.nan] * 5 + [0.0]
+    
+    mean, std, low, high = _block_moments(values)
+    
+    lo, hi = (n - 1) // 2, n // 2
+    values.partition([lo, hi])
+    median = (values[lo] + values[hi]) / 2
+    
+    return [mean, median, std, low, high, float(n)]
+
+
 def get_summary_statistics(df: pd.DataFrame, metrics: list) -> pd.DataFrame:
     """
     Calculate summary statistics for selected metrics
@@ -139,21 +548,112 @@ def get_summary_statistics(df: pd.DataFrame, metrics: list) -> pd.DataFrame:
     Returns:
         DataFrame with summary statistics
     """
-    stats_dict = {}
+    metrics = [m for m in metrics if m in df.columns]
+    
+    if not metrics:
+        return pd.DataFrame()
+    
+    rows = [_column_summary(df[metric].to_numpy(dtype=np.float64, na_value=np.nan)) for metric in metrics]
+    
+    return pd.DataFrame(rows, index=metrics, columns=['Mean', 'Median', 'Std Dev', 'Min', 'Max', 'Count'])
+
+
+def _average_by_calendar_part(df, metrics: list, part: str, name: str) -> pd.DataFrame:
+    """
+    Average metrics grouped by a Timestamp component
+    
+    The query is written against Narwhals, so Polars (eager or lazy) and
+    PyArrow inputs are aggregated natively with no conversion. pandas input
+    is handed to Polars, whose multi-threaded group-by beats pandas' own even
+    after the copy.
+    
+    Args:
+        df: Solar dataset as a pandas, Polars or PyArrow table
+        metrics: List of metric columns to average
+        part: Temporal accessor to group by ('hour' or 'month')
+        name: Name of the resulting group column
+        
+    Returns:
+        pandas DataFrame with the group column and one column per metric
+    """
+    if isinstance(df, pd.DataFrame):
+        columns = [c for c in ['Timestamp'] + list(metrics) if c in df.columns]
+        df = pl.from_pandas(df[columns])
+    
+    frame = nw.from_native(df)
+    available = frame.collect_schema().names()
+    metrics = [m for m in metrics if m in available]
+    
+    if 'Timestamp' not in available or not metrics:
+        return pd.DataFrame()
+    
+    # Rows without a timestamp belong to no hour or month
+    key = getattr(nw.col('Timestamp').dt, part)().alias(name)
+    result = (
+        frame
+        .filter(~nw.col('Timestamp').is_null())
+        .group_by(key)
+        .agg([nw.col(m).mean() for m in metrics])
+        .sort(name)
+    )
     
-    for metric in metrics:
-        if metric in df.columns:
-            stats_dict[metric] = {
-                'Mean': df[metric].mean(),
-                'Median': df[metric].median(),
-                'Std Dev': df[metric].std(),
-                'Min': df[metric].min(),
-                'Max': df[metric].max(),
-                'Count': df[metric].count()
-            }
+    if isinstance(result, nw.LazyFrame):
+        result = result.collect()
     
-    stats_df = pd.DataFrame(stats_dict).T
-    return stats_df
+    return result.to_pandas()
+
+
+def get_hourly_averages(df, metrics: list) -> pd.DataFrame:
+    """
+    Calculate the average of each metric by hour of day
+    
+    Args:
+        df: Solar dataset (pandas, Polars or PyArrow)
+        metrics: List of metric columns to average
+        
+    Returns:
+        pandas DataFrame with an 'Hour' column and one column per metric
+    """
+    return _average_by_calendar_part(df, metrics, 'hour', 'Hour')
+
+
+def get_monthly_averages(df, metrics: list) -> pd.DataFrame:
+    """
+    Calculate the average of each metric by calendar month
+    
+    Args:
+        df: Solar dataset (pandas, Polars or PyArrow)
+        metrics: List of metric columns to average
+        
+    Returns:
+        pandas DataFrame with a 'Month' column (1-12) and one column per metric
+    """
+    return _average_by_calendar_part(df, metrics, 'month', 'Month')
+
+
+def get_correlation_matrix(df: pd.DataFrame, metrics: list) -> pd.DataFrame:
+    """
+    Calculate the pairwise correlation matrix for the given metrics
+    
+    Args:
+        df: Solar dataset DataFrame
+        metrics: List of metric columns to correlate
+        
+    Returns:
+        Square DataFrame of Pearson correlations
+    """
+    metrics = [m for m in metrics if m in df.columns]
+    values = df[metrics].to_numpy(dtype='float64', na_value=np.nan)
+    
+    if len(metrics) < 2 or len(values) < 2 or np.isnan(values).any():
+        # pandas drops missing values pairwise and returns NaN without
+        # warnings when fewer than two rows are left
+        return df[metrics].corr()
+    
+    # Complete data: one BLAS pass without pairwise NaN masking
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.corrcoef(values, rowvar=False)
+    return pd.DataFrame(corr, index=metrics, columns=metrics)
 
 
 def get_top_hours(df: pd.DataFrame, metric: str, top_n: int = 10) -> pd.DataFrame:
@@ -171,7 +671,27 @@ def get_top_hours(df: pd.DataFrame, metric: str, top_n: int = 10) -> pd.DataFram
     if metric not in df.columns or 'Timestamp' not in df.columns:
         return pd.DataFrame()
     
-    top_df = df.nlargest(top_n, metric)[['Timestamp', metric]].copy()
-    top_df.reset_index(drop=True, inplace=True)
+    # NaNs are never selected: with fewer than top_n finite values the table
+    # is shorter, where DataFrame.nlargest would pad it with NaN rows
+    values = df[metric].to_numpy(dtype='float64', na_value=np.nan)
+    values = np.where(np.isnan(values), -np.inf, values)
+    top_n = min(top_n, int(np.isfinite(values).sum()))
+    
+    if top_n <= 0:
+        return df[['Timestamp', metric]].iloc[:0].reset_index(drop=True)
+    
+    # O(n) partial selection finds the cutoff value; rows tied at the cutoff
+    # are filled in row order, so ties resolve to the earliest rows as in nlargest
+    kth = np.partition(values, len(values) - top_n)[len(values) - top_n]
+    above = np.flatnonzero(values > kth)
+    tied = np.flatnonzero(values == kth)[:top_n - len(above)]
+    
+    # Sort only the top_n winners; the stable sort keeps equal values in row order
+    idx = np.concatenate([above, tied])
+    idx = idx[np.argsort(-values[idx], kind='stable')]
+    
+    # Take the rows before projecting, so only top_n values are copied
+    cols = [df.columns.get_loc('Timestamp'), df.columns.get_loc(metric)]
+    top_df = df.iloc[idx, cols].reset_index(drop=True)
     
     return top_df
@@ -4,17 +4,88 @@ Provides reusable plotting functions for data visualization
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 
+from src.data_loader import get_correlation_matrix, get_hourly_averages, get_monthly_averages
 
-# Set styling
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 6)
+# plotly.express is imported inside the functions that use it; it pulls in
+# a large part of Plotly that the graph_objects-only plots never need
+
+# Largest correlation matrix whose cells are annotated with their values
+HEATMAP_LABEL_LIMIT = 12
+
+# Axis labels for calendar months, indexed by month number - 1
+MONTH_NAMES = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                        'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+
+
+def _finite_values(values: pd.Series) -> np.ndarray:
+    """
+    Non-missing values of a column as a contiguous float32 array
+    
+    Unlike Series.dropna() this copies no index, and Plotly serializes
+    float32 arrays as compact binary rather than a JSON list.
+    
+    Args:
+        values: Metric column
+        
+    Returns:
+        1-D float32 array without NaN
+    """
+    arr = values.to_numpy(dtype=np.float32, na_value=np.nan)
+    return arr[~np.isnan(arr)]
+
+
+def _sample_rows(df: pd.DataFrame, max_rows: int, columns: list) -> pd.DataFrame:
+    """
+    Uniformly sample at most `max_rows` rows, keeping only the plotted columns
+    
+    Positions are drawn with a fixed-seed NumPy generator, so the sample is
+    stable across reruns, and rows and columns are taken in one iloc.
+    
+    Args:
+        df: Solar dataset DataFrame
+        max_rows: Maximum number of rows to return
+        columns: Columns the plot needs (None or missing entries are ignored)
+        
+    Returns:
+        The original frame if small enough, otherwise the sampled rows in order
+    """
+    if len(df) <= max_rows:
+        return df
+    
+    cols = [df.columns.get_loc(col) for col in dict.fromkeys(columns) if col in df.columns]
+    idx = np.random.default_rng(0).choice(len(df), size=max_rows, replace=False)
+    
+    return df.iloc[np.sort(idx), cols]
+
+
+def _histogram_bars(values: np.ndarray, bins=50, density: bool = False, **trace_kwargs) -> go.Bar:
+    """
+    Bin values with NumPy and return the histogram as a Bar trace
+    
+    Only the bin centres and heights reach the browser, instead of every
+    raw sample for Plotly.js to bin client-side.
+    
+    Args:
+        values: 1-D array without NaN
+        bins: Number of equal-width bins, or an array of bin edges
+        density: Normalise heights to a probability density
+        **trace_kwargs: Extra go.Bar properties (name, marker_color, ...)
+        
+    Returns:
+        Plotly Bar trace with one bar per bin
+    """
+    # An empty column has no density to normalise; plot zero-height bins
+    heights, edges = np.histogram(values, bins=bins, density=density and values.size > 0)
+    
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=heights,
+        width=np.diff(edges),
+        **trace_kwargs
+    )
 
 
 def create_boxplot(df: pd.DataFrame, metrics: list, title: str = "Metric Comparison") -> go.Figure:
@@ -36,7 +107,7 @@ def create_boxplot(df: pd.DataFrame, metrics: list, title: str = "Metric Compari
         if metric in df.columns:
             data_to_plot.append(
                 go.Box(
-                    y=df[metric].dropna(),
+                    y=_finite_values(df[metric]),
                     name=metric,
                     boxmean='sd'  # Show mean and standard deviation
                 )
@@ -56,7 +127,69 @@ def create_boxplot(df: pd.DataFrame, metrics: list, title: str = "Metric Compari
     return fig
 
 
-def create_time_series(df: pd.DataFrame, metric: str, title: str = None) -> go.Figure:
+def downsample_lttb(df: pd.DataFrame, metric: str, n_out: int = 2000) -> pd.DataFrame:
+    """
+    Reduce a time series to `n_out` visually significant rows (LTTB)
+    
+    Largest-Triangle-Three-Buckets keeps the first and last rows and, from
+    each bucket in between, the row forming the largest triangle with the
+    previously kept row and the average of the next bucket, which preserves
+    peaks and troughs far better than uniform sampling.
+    
+    Args:
+        df: Solar dataset DataFrame sorted by Timestamp
+        metric: Metric column to downsample
+        n_out: Number of rows to keep (roughly the plot width in pixels)
+        
+    Returns:
+        DataFrame with the selected rows in their original order
+    """
+    n_rows = len(df)
+    
+    if 'Timestamp' not in df.columns or metric not in df.columns or n_out < 3 or n_rows <= n_out:
+        return df
+    
+    # Seconds from the first sample keep the float arithmetic well conditioned
+    ts = df['Timestamp'].to_numpy()
+    x = (ts - ts[0]) / np.timedelta64(1, 's')
+    y = df[metric].to_numpy(dtype=float, na_value=np.nan)
+    
+    every = (n_rows - 2) / (n_out - 2)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n_rows - 1
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n_rows)
+        
+        # Average of the next bucket (the last row for the final bucket); an
+        # all-missing bucket falls back to the anchor, then to this bucket
+        next_y = y[end:next_end] if end < next_end else y[-1:]
+        next_x = x[end:next_end] if end < next_end else x[-1:]
+        avg_x = next_x.mean()
+        avg_y = np.nan
+        for candidate in (next_y, y[a:a + 1], y[start:end]):
+            finite = candidate[~np.isnan(candidate)]
+            if finite.size:
+                avg_y = finite.mean()
+                break
+        
+        # An anchor inside a NaN gap is replaced by that average, so the pick
+        # becomes the row furthest from it rather than an arbitrary one
+        anchor_y = avg_y if np.isnan(y[a]) else y[a]
+        
+        area = np.abs((x[a] - avg_x) * (y[start:end] - anchor_y)
+                      - (x[a] - x[start:end]) * (avg_y - anchor_y))
+        a = start + int(np.argmax(np.where(np.isnan(area), -1.0, area)))
+        keep[i + 1] = a
+    
+    return df.iloc[keep]
+
+
+def create_time_series(df: pd.DataFrame, metric: str, title: str = None,
+                       webgl: bool = True, max_points: int = 5000) -> go.Figure:
     """
     Create an interactive time series plot
     
@@ -64,22 +197,31 @@ def create_time_series(df: pd.DataFrame, metric: str, title: str = None) -> go.F
         df: Solar dataset DataFrame
         metric: Metric column to plot
         title: Plot title (auto-generated if None)
+        webgl: Render with WebGL (scattergl); pass False to force SVG
+        max_points: Longer series are reduced to this many points with LTTB
         
     Returns:
         Plotly Figure object
     """
+    import plotly.express as px
+    
     if 'Timestamp' not in df.columns or metric not in df.columns:
         return go.Figure()
     
     if title is None:
         title = f"{metric} Over Time"
     
+    # Serializing and drawing every row dominates for long series
+    if len(df) > max_points:
+        df = downsample_lttb(df, metric, max_points)
+    
     fig = px.line(
         df, 
         x='Timestamp', 
         y=metric,
         title=title,
-        labels={'Timestamp': 'Date/Time', metric: f'{metric} Value'}
+        labels={'Timestamp': 'Date/Time', metric: f'{metric} Value'},
+        render_mode='webgl' if webgl else 'auto'
     )
     
     fig.update_traces(line=dict(color='#1f77b4', width=1.5))
@@ -93,13 +235,15 @@ def create_time_series(df: pd.DataFrame, metric: str, title: str = None) -> go.F
     return fig
 
 
-def create_correlation_heatmap(df: pd.DataFrame, metrics: list = None) -> go.Figure:
+def create_correlation_heatmap(df: pd.DataFrame, metrics: list = None,
+                               corr_matrix: pd.DataFrame = None) -> go.Figure:
     """
     Create a correlation heatmap for numeric columns
     
     Args:
         df: Solar dataset DataFrame
         metrics: List of metrics to include (if None, use all numeric columns)
+        corr_matrix: Precomputed correlation matrix covering the metrics (optional)
         
     Returns:
         Plotly Figure object
@@ -114,8 +258,33 @@ def create_correlation_heatmap(df: pd.DataFrame, metrics: list = None) -> go.Fig
     if len(numeric_cols) < 2:
         return go.Figure()
     
-    # Calculate correlation matrix
-    corr_matrix = df[numeric_cols].corr()
+    # Calculate correlation matrix unless the caller already has one
+    if corr_matrix is None:
+        corr_matrix = get_correlation_matrix(df, numeric_cols)
+    else:
+        corr_matrix = corr_matrix.loc[numeric_cols, numeric_cols]
+    
+    return create_correlation_heatmap_from_matrix(corr_matrix)
+
+
+def create_correlation_heatmap_from_matrix(corr_matrix: pd.DataFrame) -> go.Figure:
+    """
+    Create a correlation heatmap from a precomputed correlation matrix
+    
+    Args:
+        corr_matrix: Square correlation matrix (e.g. from DataFrame.corr)
+        
+    Returns:
+        Plotly Figure object
+    """
+    if len(corr_matrix.columns) < 2:
+        return go.Figure()
+    
+    # Cell labels are formatted from z by Plotly, so no text matrix is shipped;
+    # past a dozen metrics they are unreadable and dropped entirely
+    labels = {}
+    if len(corr_matrix.columns) <= HEATMAP_LABEL_LIMIT:
+        labels = dict(texttemplate='%{z:.2f}', textfont={"size": 10})
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
@@ -124,10 +293,8 @@ def create_correlation_heatmap(df: pd.DataFrame, metrics: list = None) -> go.Fig
         y=corr_matrix.columns,
         colorscale='RdBu',
         zmid=0,
-        text=np.round(corr_matrix.values, 2),
-        texttemplate='%{text}',
-        textfont={"size": 10},
-        colorbar=dict(title="Correlation")
+        colorbar=dict(title="Correlation"),
+        **labels
     ))
     
     fig.update_layout(
@@ -140,7 +307,8 @@ def create_correlation_heatmap(df: pd.DataFrame, metrics: list = None) -> go.Fig
 
 
 def create_scatter_plot(df: pd.DataFrame, x_metric: str, y_metric: str, 
-                       color_metric: str = None) -> go.Figure:
+                       color_metric: str = None, webgl: bool = True,
+                       max_points: int = 10000) -> go.Figure:
     """
     Create an interactive scatter plot
     
@@ -149,13 +317,21 @@ def create_scatter_plot(df: pd.DataFrame, x_metric: str, y_metric: str,
         x_metric: Metric for x-axis
         y_metric: Metric for y-axis
         color_metric: Optional metric for color coding
+        webgl: Render with WebGL (scattergl); pass False to force SVG
+        max_points: Larger datasets are uniformly sampled down to this many rows
         
     Returns:
         Plotly Figure object
     """
+    import plotly.express as px
+    
     if x_metric not in df.columns or y_metric not in df.columns:
         return go.Figure()
     
+    render_mode = 'webgl' if webgl else 'auto'
+    
+    df = _sample_rows(df, max_points, [x_metric, y_metric, color_metric])
+    
     if color_metric and color_metric in df.columns:
         fig = px.scatter(
             df, 
@@ -164,7 +340,8 @@ def create_scatter_plot(df: pd.DataFrame, x_metric: str, y_metric: str,
             color=color_metric,
             title=f"{y_metric} vs {x_metric}",
             labels={x_metric: x_metric, y_metric: y_metric},
-            opacity=0.6
+            opacity=0.6,
+            render_mode=render_mode
         )
     else:
         fig = px.scatter(
@@ -173,7 +350,8 @@ def create_scatter_plot(df: pd.DataFrame, x_metric: str, y_metric: str,
             y=y_metric,
             title=f"{y_metric} vs {x_metric}",
             labels={x_metric: x_metric, y_metric: y_metric},
-            opacity=0.6
+            opacity=0.6,
+            render_mode=render_mode
         )
     
     fig.update_layout(
@@ -185,7 +363,8 @@ def create_scatter_plot(df: pd.DataFrame, x_metric: str, y_metric: str,
 
 
 def create_bubble_chart(df: pd.DataFrame, x_metric: str, y_metric: str, 
-                       size_metric: str, color_metric: str = None) -> go.Figure:
+                       size_metric: str, color_metric: str = None,
+                       webgl: bool = True) -> go.Figure:
     """
     Create an interactive bubble chart
     
@@ -195,16 +374,19 @@ def create_bubble_chart(df: pd.DataFrame, x_metric: str, y_metric: str,
         y_metric: Metric for y-axis
         size_metric: Metric for bubble size
         color_metric: Optional metric for color coding
+        webgl: Render with WebGL (scattergl); pass False to force SVG
         
     Returns:
         Plotly Figure object
     """
+    import plotly.express as px
+    
     required_cols = [x_metric, y_metric, size_metric]
     if not all(col in df.columns for col in required_cols):
         return go.Figure()
     
     # Sample data if too large for performance
-    plot_df = df.sample(min(1000, len(df))) if len(df) > 1000 else df
+    plot_df = _sample_rows(df, 1000, required_cols + [color_metric])
     
     if color_metric and color_metric in df.columns:
         fig = px.scatter(
@@ -216,7 +398,8 @@ def create_bubble_chart(df: pd.DataFrame, x_metric: str, y_metric: str,
             title=f"Bubble Chart: {y_metric} vs {x_metric}",
             labels={x_metric: x_metric, y_metric: y_metric},
             opacity=0.6,
-            size_max=30
+            size_max=30,
+            render_mode='webgl' if webgl else 'auto'
         )
     else:
         fig = px.scatter(
@@ -227,7 +410,8 @@ def create_bubble_chart(df: pd.DataFrame, x_metric: str, y_metric: str,
             title=f"Bubble Chart: {y_metric} vs {x_metric}",
             labels={x_metric: x_metric, y_metric: y_metric},
             opacity=0.6,
-            size_max=30
+            size_max=30,
+            render_mode='webgl' if webgl else 'auto'
         )
     
     fig.update_layout(
@@ -251,21 +435,27 @@ def create_wind_distribution(df: pd.DataFrame) -> go.Figure:
     if 'WS' not in df.columns:
         return go.Figure()
     
+    speed = _finite_values(df['WS'])
+    gust = _finite_values(df['WSgust']) if 'WSgust' in df.columns else speed[:0]
+    
+    # Overlaid series share bin edges, as Plotly's own histograms would
+    edges = np.histogram_bin_edges(np.concatenate([speed, gust]), bins=50)
+    
     # Create histogram
     fig = go.Figure()
     
-    fig.add_trace(go.Histogram(
-        x=df['WS'].dropna(),
-        nbinsx=50,
+    fig.add_trace(_histogram_bars(
+        speed,
+        bins=edges,
         name='Wind Speed',
         marker_color='lightblue',
         opacity=0.7
     ))
     
     if 'WSgust' in df.columns:
-        fig.add_trace(go.Histogram(
-            x=df['WSgust'].dropna(),
-            nbinsx=50,
+        fig.add_trace(_histogram_bars(
+            gust,
+            bins=edges,
             name='Wind Gust',
             marker_color='orange',
             opacity=0.7
@@ -276,6 +466,7 @@ def create_wind_distribution(df: pd.DataFrame) -> go.Figure:
         xaxis_title="Wind Speed (m/s)",
         yaxis_title="Frequency",
         barmode='overlay',
+        bargap=0,
         height=500,
         template="plotly_white"
     )
@@ -297,12 +488,25 @@ def create_hourly_pattern(df: pd.DataFrame, metric: str) -> go.Figure:
     if 'Timestamp' not in df.columns or metric not in df.columns:
         return go.Figure()
     
-    # Extract hour from timestamp
-    df_copy = df.copy()
-    df_copy['Hour'] = df_copy['Timestamp'].dt.hour
-    
     # Calculate hourly averages
-    hourly_avg = df_copy.groupby('Hour')[metric].mean().reset_index()
+    hourly_avg = get_hourly_averages(df, [metric])
+    
+    return create_hourly_pattern_from_agg(hourly_avg, metric)
+
+
+def create_hourly_pattern_from_agg(hourly_avg: pd.DataFrame, metric: str) -> go.Figure:
+    """
+    Create hourly pattern plot from precomputed hourly averages
+    
+    Args:
+        hourly_avg: DataFrame with an 'Hour' column and one column per metric
+        metric: Metric to plot
+        
+    Returns:
+        Plotly Figure object
+    """
+    if 'Hour' not in hourly_avg.columns or metric not in hourly_avg.columns:
+        return go.Figure()
     
     fig = go.Figure()
     
@@ -341,22 +545,33 @@ def create_monthly_pattern(df: pd.DataFrame, metric: str) -> go.Figure:
     if 'Timestamp' not in df.columns or metric not in df.columns:
         return go.Figure()
     
-    # Extract month from timestamp
-    df_copy = df.copy()
-    df_copy['Month'] = df_copy['Timestamp'].dt.month
-    
     # Calculate monthly averages
-    monthly_avg = df_copy.groupby('Month')[metric].mean().reset_index()
+    monthly_avg = get_monthly_averages(df, [metric])
     
-    # Month names for better labeling
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    monthly_avg['MonthName'] = monthly_avg['Month'].apply(lambda x: month_names[x-1])
+    return create_monthly_pattern_from_agg(monthly_avg, metric)
+
+
+def create_monthly_pattern_from_agg(monthly_avg: pd.DataFrame, metric: str) -> go.Figure:
+    """
+    Create monthly pattern plot from precomputed monthly averages
+    
+    Args:
+        monthly_avg: DataFrame with a 'Month' column (1-12) and one column per metric
+        metric: Metric to plot
+        
+    Returns:
+        Plotly Figure object
+    """
+    if 'Month' not in monthly_avg.columns or metric not in monthly_avg.columns:
+        return go.Figure()
+    
+    # Month names for better labeling, looked up for all rows at once
+    month_labels = MONTH_NAMES[monthly_avg['Month'].to_numpy(dtype=np.intp) - 1]
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=monthly_avg['MonthName'],
+        x=month_labels,
         y=monthly_avg[metric],
         name=metric,
         marker_color='lightblue'
@@ -387,24 +602,24 @@ def create_distribution_plot(df: pd.DataFrame, metric: str) -> go.Figure:
     if metric not in df.columns:
         return go.Figure()
     
-    data = df[metric].dropna()
+    data = _finite_values(df[metric])
     
     fig = go.Figure()
     
     # Add histogram
-    fig.add_trace(go.Histogram(
-        x=data,
-        nbinsx=50,
+    fig.add_trace(_histogram_bars(
+        data,
+        density=True,
         name='Distribution',
         marker_color='lightblue',
-        opacity=0.7,
-        histnorm='probability density'
+        opacity=0.7
     ))
     
     fig.update_layout(
         title=f"{metric} Distribution",
         xaxis_title=metric,
         yaxis_title="Density",
+        bargap=0,
         height=500,
         template="plotly_white"
     )
@@ -0,0 +1,171 @@
+"""
+Tests for src.data_loader
+"""
+
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_loader import get_correlation_matrix, get_top_hours, load_solar_data, read_csv_columns, read_csv_polars
+
+
+AMBIGUOUS_CSV = b"Timestamp,GHI\n08/09/2021 00:00,1.0\n08/10/2021 00:00,2.0\n"
+
+
+def test_read_csv_polars_parses_ambiguous_dates_month_first():
+    df = read_csv_polars(AMBIGUOUS_CSV)
+    
+    assert list(df['Timestamp']) == [pd.Timestamp('2021-08-09'), pd.Timestamp('2021-08-10')]
+
+
+def test_read_csv_polars_date_order_does_not_depend_on_the_data():
+    # A day above 12 must not switch the other rows to a different order
+    df = read_csv_polars(AMBIGUOUS_CSV + b"08/13/2021 00:00,3.0\n")
+    
+    assert df['Timestamp'].iloc[0] == pd.Timestamp('2021-08-09')
+    assert df['Timestamp'].iloc[-1] == pd.Timestamp('2021-08-13')
+
+
+def test_read_csv_polars_keeps_timestamp_text_without_parse_dates():
+    df = read_csv_polars(AMBIGUOUS_CSV, parse_dates=False)
+    
+    assert df['Timestamp'].iloc[0] == '08/09/2021 00:00'
+
+
+def test_load_solar_data_sidecar_keeps_month_first_dates(tmp_path):
+    csv_path = tmp_path / "site.csv"
+    csv_path.write_bytes(AMBIGUOUS_CSV)
+    
+    first = load_solar_data(str(csv_path))
+    # The second load is served from the Parquet copy written by the first
+    second = load_solar_data(str(csv_path))
+    
+    assert (tmp_path / "site.csv.parquet").exists()
+    for df in (first, second):
+        assert df['Timestamp'].iloc[0] == pd.Timestamp('2021-08-09')
+
+
+def test_load_solar_data_sidecar_does_not_overwrite_users_parquet(tmp_path):
+    own = tmp_path / "site.parquet"
+    pd.DataFrame({'mine': [1]}).to_parquet(own)
+    csv_path = tmp_path / "site.csv"
+    csv_path.write_bytes(AMBIGUOUS_CSV)
+    
+    load_solar_data(str(csv_path))
+    
+    assert list(pd.read_parquet(own).columns) == ['mine']
+
+
+def test_load_solar_data_sidecars_do_not_collide_across_extensions(tmp_path):
+    (tmp_path / "b.csv").write_bytes(b"Timestamp,GHI\n2021-08-09,1.0\n2021-08-10,2.0\n")
+    (tmp_path / "b.txt").write_bytes(b"Timestamp,GHI\n2021-08-09,99.0\n")
+    
+    load_solar_data(str(tmp_path / "b.csv"))
+    
+    assert list(load_solar_data(str(tmp_path / "b.txt"))['GHI']) == [99.0]
+    assert list(load_solar_data(str(tmp_path / "b.csv"))['GHI']) == [1.0, 2.0]
+
+
+def test_load_solar_data_sidecar_is_stale_when_csv_replaced_by_older_file(tmp_path):
+    csv_path = tmp_path / "site.csv"
+    csv_path.write_bytes(b"Timestamp,GHI\n2021-08-09,1.0\n")
+    load_solar_data(str(csv_path))
+    
+    # Replaced by a copy with an older mtime, as unzip or cp -p would leave it
+    csv_path.write_bytes(b"Timestamp,GHI\n2021-08-09,7.0\n")
+    os.utime(csv_path, ns=(1_000_000_000, 1_000_000_000))
+    
+    assert list(load_solar_data(str(csv_path))['GHI']) == [7.0]
+
+
+def test_load_solar_data_parses_and_stores_only_requested_columns(tmp_path, monkeypatch):
+    csv_path = tmp_path / "site.csv"
+    csv_path.write_bytes(b"Timestamp,GHI,DNI,Comments\n2021-08-09,1.0,2.0,ok\n")
+    
+    first = load_solar_data(str(csv_path), columns=['Timestamp', 'GHI', 'WS'])
+    assert list(first.columns) == ['Timestamp', 'GHI']
+    assert list(pd.read_parquet(tmp_path / "site.csv.parquet").columns) == ['Timestamp', 'GHI']
+    
+    # A subset of the stored projection is served from the copy
+    with monkeypatch.context() as patch:
+        patch.setattr('src.data_loader.read_csv_polars', _fail_if_parsed)
+        patch.setattr('src.data_loader.read_csv_columns', _fail_if_parsed)
+        assert list(load_solar_data(str(csv_path), columns=['GHI'])['GHI']) == [1.0]
+    
+    # Columns outside it, or the whole table, mean parsing the CSV again
+    assert list(load_solar_data(str(csv_path), columns=['DNI']).columns) == ['DNI']
+    assert list(load_solar_data(str(csv_path)).columns) == ['Timestamp', 'GHI', 'DNI', 'Comments']
+
+
+def _fail_if_parsed(*args, **kwargs):
+    raise AssertionError("CSV parsed despite an up-to-date Parquet copy")
+
+
+def test_read_csv_polars_parses_iso_timestamps():
+    df = read_csv_polars(b"Timestamp,GHI\n2021-08-09 10:30,1.0\n")
+    
+    assert df['Timestamp'].iloc[0] == pd.Timestamp('2021-08-09 10:30')
+    assert df['GHI'].dtype == 'float32'
+
+
+def _hourly_frame(values):
+    return pd.DataFrame({
+        'Timestamp': pd.date_range('2021-08-09', periods=len(values), freq='h'),
+        'GHI': values,
+    })
+
+
+def test_get_top_hours_resolves_ties_like_nlargest():
+    df = _hourly_frame([1.0] * 15)
+    
+    top = get_top_hours(df, 'GHI', top_n=10)
+    expected = df.nlargest(10, 'GHI')[['Timestamp', 'GHI']].reset_index(drop=True)
+    
+    pd.testing.assert_frame_equal(top, expected)
+
+
+def test_get_top_hours_orders_mixed_ties_like_nlargest():
+    df = _hourly_frame([5.0, 1.0, 3.0, 5.0, 3.0, 3.0, 0.0, 3.0, 5.0, 3.0])
+    
+    top = get_top_hours(df, 'GHI', top_n=5)
+    expected = df.nlargest(5, 'GHI')[['Timestamp', 'GHI']].reset_index(drop=True)
+    
+    pd.testing.assert_frame_equal(top, expected)
+
+
+def test_get_top_hours_skips_missing_values():
+    df = _hourly_frame([np.nan, 2.0, np.nan, 1.0])
+    
+    top = get_top_hours(df, 'GHI', top_n=10)
+    
+    assert list(top['GHI']) == [2.0, 1.0]
+
+
+def test_read_csv_columns_skips_missing_names():
+    data = b"Timestamp,GHI,Comments\n2021-08-09 10:30,1.0,ok\n"
+    
+    df = read_csv_columns(data, columns=['Timestamp', 'GHI', 'WS'])
+    
+    assert list(df.columns) == ['Timestamp', 'GHI']
+
+
+@pytest.mark.parametrize('n_rows', [0, 1])
+def test_get_correlation_matrix_is_silent_on_too_few_rows(n_rows):
+    df = pd.DataFrame({'GHI': np.arange(n_rows, dtype=float), 'DNI': np.arange(n_rows, dtype=float)})
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        corr = get_correlation_matrix(df, ['GHI', 'DNI'])
+    
+    assert corr.shape == (2, 2)
+    assert corr.isna().all().all()
+
+
+def test_get_correlation_matrix_matches_pandas_on_complete_data():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((50, 3)), columns=['GHI', 'DNI', 'DHI'])
+    
+    pd.testing.assert_frame_equal(get_correlation_matrix(df, ['GHI', 'DNI', 'DHI']), df.corr())
@@ -0,0 +1,54 @@
+"""
+Tests for src.plot_utils
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.plot_utils import downsample_lttb
+
+
+def _minute_frame(values):
+    return pd.DataFrame({
+        'Timestamp': pd.date_range('2021-08-09', periods=len(values), freq='min'),
+        'GHI': values,
+    })
+
+
+def test_downsample_lttb_keeps_first_and_last_rows():
+    df = _minute_frame(np.sin(np.arange(10_000) / 300))
+    
+    out = downsample_lttb(df, 'GHI', n_out=200)
+    
+    assert len(out) == 200
+    assert out.index[0] == 0 and out.index[-1] == len(df) - 1
+    assert out.index.is_monotonic_increasing
+
+
+def test_downsample_lttb_keeps_spikes():
+    values = np.sin(np.arange(10_000) / 300)
+    values[2_345] = 50.0
+    values[7_777] = -40.0
+    
+    out = downsample_lttb(_minute_frame(values), 'GHI', n_out=200)
+    
+    assert {2_345, 7_777} <= set(out.index)
+
+
+def test_downsample_lttb_handles_nan_gaps():
+    values = np.sin(np.arange(10_000) / 300)
+    values[:50] = np.nan
+    values[20] = 99.0
+    values[4_000:5_000] = np.nan
+    values[5_003] = 50.0
+    
+    out = downsample_lttb(_minute_frame(values), 'GHI', n_out=200)
+    
+    assert len(out) == 200
+    assert {20, 5_003} <= set(out.index)
+
+
+def test_downsample_lttb_returns_short_series_unchanged():
+    df = _minute_frame(np.arange(100.0))
+    
+    assert downsample_lttb(df, 'GHI', n_out=200) is df